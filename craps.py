@@ -6,11 +6,17 @@ Supports multiple bet types:
 - Pass Line / Don't Pass with odds
 - Multi-roll side bets (low numbers, high numbers, all numbers)
 - Single-roll bets (field, twelve)
+- Come / Don't Come bets with odds
+
+Betting strategies decide the line, odds and come bets from the current state
+(bankroll, point, losing streak, numbers rolled). Built-in strategies such as
+Martingale and 3-4-5x odds are lowered to precomputed lookup tables.
 
 Runs multiple simulations and provides statistical analysis of results.
 """
 
 import random
+from types import MappingProxyType
 
 ### CONFIGURATION SECTION ###
 
@@ -30,7 +36,10 @@ num_simulations = 10000  # number of times to run the full simulation
 seed = None  # set to an integer for repeatable results, None for random
 debug = False  # Enable detailed logging of each roll
 
-strategy = 'dont_pass' # Choose betting strategy: 'pass_line' or 'dont_pass'
+strategy = 'dont_pass' # Choose betting strategy (see STRATEGY DEFINITIONS):
+                       # 'pass_line', 'dont_pass', 'martingale', 'pass_line_345x_odds' or 'pass_line_come_bets'
+martingale_max_doublings = 5  # Martingale: main bet doubles after each loss, at most this many times
+max_come_bets = 2  # Come bets: number of come points kept working at once
 
 # Bet amounts (in dollars)
 bet_pass_line = 3  # Main pass line bet
@@ -80,8 +89,103 @@ def calculate_odds_payout(point, odds_bet, is_pass_line, won):
     multiplier = PASS_ODDS_MULTIPLIER[point] if is_pass_line else DONT_PASS_ODDS_MULTIPLIER[point]
     return odds_bet * multiplier
 
+### STRATEGY DEFINITIONS ###
+
+POINT_NUMBERS = (4, 5, 6, 8, 9, 10)
+
+def make_strategy(pass_line=True, main_bet=0, odds_bet=0, come_bet=0, max_come_bets=0, name=None):
+    """
+    Build a betting strategy from decision rules. name is shown in the results.
+    Each rule is either a lookup table or a function rule(state, index) returning a bet amount.
+    state is a dict with:
+    - bankroll: bankroll at the start of the round, before this round's bets
+    - point: current point, None on the come out roll
+    - losses_in_row: line bets lost in a row
+    - numbers_rolled: frozenset of numbers rolled since the last 7, as of the start of the round
+    - come_points: read-only view of {number: (flat bet, odds bet)} for come bets on numbers
+    The rules are:
+    - main_bet: line bet per round, table indexed by losses in a row
+    - odds_bet: odds behind the line or a come point, table indexed by point (a dict {point: amount} works too)
+    - come_bet: come bet per roll while a point is on, table indexed by come points working
+    A plain number is lowered to a one-entry table. Past the end of a table the last entry is reused.
+    """
+    def lower(rule):
+        if callable(rule):
+            return rule
+        if isinstance(rule, dict):
+            return [rule.get(number, 0) for number in range(13)]
+        if isinstance(rule, (int, float)):
+            return [rule]
+        return list(rule)
+
+    if isinstance(odds_bet, (int, float)):
+        odds_bet = {point: odds_bet for point in POINT_NUMBERS}
+
+    rules = {
+        'main_bet': lower(main_bet),
+        'odds_bet': lower(odds_bet),
+        'come_bet': lower(come_bet)
+    }
+    return {
+        'pass_line': pass_line,
+        **rules,
+        'max_come_bets': max_come_bets,
+        'uses_state': any(callable(rule) for rule in rules.values()),  # tables never read the state
+        'name': name
+    }
+
+def build_strategies():
+    """Build the built-in strategies from the current bet configuration. Add custom strategies here."""
+    odds_345x = {4: 3, 5: 4, 6: 5, 8: 5, 9: 4, 10: 3}  # 3x on 4/10, 4x on 5/9, 5x on 6/8
+    return {
+        'pass_line': make_strategy(True, bet_pass_line, bet_odds, name='Pass Line'),
+        'dont_pass': make_strategy(False, bet_pass_line, bet_odds, name="Don't Pass"),
+        'martingale': make_strategy(True, [bet_pass_line * 2**n for n in range(martingale_max_doublings + 1)],
+                                    name='Martingale (Pass Line)'),
+        'pass_line_345x_odds': make_strategy(True, bet_pass_line,
+                                             {point: bet_pass_line * x for point, x in odds_345x.items()},
+                                             name='Pass Line with 3-4-5x Odds'),
+        'pass_line_come_bets': make_strategy(True, bet_pass_line, bet_odds, bet_pass_line, max_come_bets,
+                                             name='Pass Line with Come Bets')
+    }
+
+def choose_bet(rule, index, state):
+    """Look up a bet in a strategy's table, or ask a custom strategy function"""
+    if type(rule) is list:
+        return rule[index] if index < len(rule) else rule[-1]
+    return rule(state, index)
+
 ### SIMULATION FUNCTIONS ###
 
+# Come bet outcome on the roll after it is placed; None means it moves to that number
+PASS_COME_OUTCOME =      [None, None, 'lose', 'lose', None, None, None, 'win', None, None, None, 'win', 'lose']
+DONT_PASS_COME_OUTCOME = [None, None, 'win', 'win', None, None, None, 'lose', None, None, None, 'lose', 'push']
+
+def resolve_come_points(roll, come_points, pass_line, odds_working, roll_details):
+    """Resolve come bets sitting on numbers, return total payout. Odds are returned when not working."""
+    total_payout = 0
+    bet_type = 'Come' if pass_line else "Don't Come"
+
+    for number in list(come_points):
+        if roll != number and roll != 7:
+            continue
+
+        flat, odds = come_points.pop(number)
+        if (roll == number) == pass_line:
+            odds_win = calculate_odds_payout(number, odds, pass_line, True) if odds_working else 0
+            total_payout += flat * 2 + odds + odds_win
+            if debug:
+                odds_status = f"Odds WINS ${odds_win}" if odds_working else f"Odds ${odds} returned"
+                roll_details.append(f"  {bet_type} on {number} WINS ${flat}, {odds_status}")
+        else:
+            if not odds_working:
+                total_payout += odds
+            if debug:
+                odds_status = f"Odds LOSES ${odds}" if odds_working else f"Odds ${odds} returned"
+                roll_details.append(f"  {bet_type} on {number} LOSES ${flat}, {odds_status}")
+
+    return total_payout
+
 def process_single_roll_bets(roll, roll_details):
     """Process field and twelve bets for a single roll, return total payout"""
     total_payout = 0
@@ -104,6 +208,75 @@ def process_single_roll_bets(roll, roll_details):
 
     return total_payout
 
+def place_come_bet(betting_strategy, state, come_points, roll_details):
+    """Place a come bet if fewer than max_come_bets come points are working, return the amount bet"""
+    if len(come_points) >= betting_strategy['max_come_bets']:
+        return 0
+
+    come_bet = choose_bet(betting_strategy['come_bet'], len(come_points), state)
+    if debug and come_bet:
+        come_type = 'Come' if betting_strategy['pass_line'] else "Don't Come"
+        roll_details.append(f"  Placed ${come_bet} on {come_type}")
+    return come_bet
+
+def play_come_bets(roll, point, come_bet, betting_strategy, state, come_points, roll_details):
+    """
+    Settle come bets on a roll while the point is on, then place the next come bet if the round goes on.
+    come_bet is the come bet waiting for this roll. Returns (payout, next come bet).
+    """
+    pass_line = betting_strategy['pass_line']
+    total_payout = 0
+
+    if come_points:
+        total_payout += resolve_come_points(roll, come_points, pass_line, True, roll_details)
+
+    if come_bet:
+        come_type = 'Come' if pass_line else "Don't Come"
+        outcome = (PASS_COME_OUTCOME if pass_line else DONT_PASS_COME_OUTCOME)[roll]
+        if outcome is None:
+            # Come bet moves to the number rolled, odds go behind it
+            come_odds = choose_bet(betting_strategy['odds_bet'], roll, state)
+            total_payout -= come_odds
+            flat, odds = come_points.get(roll, (0, 0))
+            come_points[roll] = (flat + come_bet, odds + come_odds)
+            if debug:
+                roll_details.append(f"  {come_type} moves to {roll}.{f' Placed ${come_odds} odds bet' if come_odds else ''}")
+        else:
+            if outcome == 'win':
+                total_payout += come_bet * 2
+            elif outcome == 'push':
+                total_payout += come_bet
+            if debug:
+                status = {'win': 'WINS', 'lose': 'LOSES', 'push': 'PUSH'}[outcome]
+                roll_details.append(f"  {come_type} {status} ${come_bet}")
+
+    # No new come bet once the point is made or sevens out
+    if roll == point or roll == 7:
+        return total_payout, 0
+
+    come_bet = place_come_bet(betting_strategy, state, come_points, roll_details)
+    return total_payout - come_bet, come_bet
+
+def settle_outstanding_come_points(come_points, pass_line):
+    """
+    Keep rolling without new bets until come bets left on the table are settled, return total payout.
+    With no line point these are come out rolls, so odds are returned rather than played.
+    """
+    total_payout = 0
+    roll_details = []
+
+    while come_points:
+        roll = roll_dice()
+        if debug:
+            roll_details.append(f"  Roll: {roll}")
+        total_payout += resolve_come_points(roll, come_points, pass_line, False, roll_details)
+
+    if debug:
+        for detail in roll_details:
+            print(detail)
+
+    return total_payout
+
 def create_result(total_payout, main_result, point, all_rolls, seven_rolled, roll_details):
     """Create a standardized result dictionary"""
     return {
@@ -115,24 +288,33 @@ def create_result(total_payout, main_result, point, all_rolls, seven_rolled, rol
         'roll_details': roll_details
     }
 
-def simulate_round(use_pass_line=True, numbers_rolled_so_far=None, round_num=0):
+def simulate_round(betting_strategy, state, come_points, round_num=0):
     """
-    Simulate a single pass/don't pass round
+    Simulate a single line bet round, betting as the strategy decides from the state.
+    come_points ({number: (flat bet, odds bet)}) stay working across rounds, with odds off on the come out roll.
     Returns: dict with payout, numbers rolled, and whether a 7 was rolled
     """
-    if numbers_rolled_so_far is None:
-        numbers_rolled_so_far = set()
+    pass_line = betting_strategy['pass_line']
+    max_come = betting_strategy['max_come_bets']
+    uses_state = betting_strategy['uses_state']
+    if uses_state:
+        state['point'] = None
 
     total_payout = 0
     all_rolls = []  # Track every roll in this round
     roll_details = []  # Detailed info for each roll for debug
 
-    # Place main bet
-    main_bet = bet_pass_line
+    # Place main bet (table lookups are inlined here rather than going through choose_bet)
+    main_rule = betting_strategy['main_bet']
+    losses = state['losses_in_row']
+    if type(main_rule) is list:
+        main_bet = main_rule[losses] if losses < len(main_rule) else main_rule[-1]
+    else:
+        main_bet = main_rule(state, losses)
     total_payout -= main_bet  # Pay the bet
 
     if debug:
-        bet_type = 'Pass Line' if use_pass_line else "Don't Pass"
+        bet_type = 'Pass Line' if pass_line else "Don't Pass"
         roll_details.append(f"Round {round_num}: Placed ${main_bet} on {bet_type}")
 
     come_out_roll = roll_dice()
@@ -144,7 +326,10 @@ def simulate_round(use_pass_line=True, numbers_rolled_so_far=None, round_num=0):
     if debug:
         roll_details.append(f"  Come out roll: {come_out_roll}")
 
-    if use_pass_line:
+    if come_points:
+        total_payout += resolve_come_points(come_out_roll, come_points, pass_line, False, roll_details)
+
+    if pass_line:
         # Pass line logic
         if come_out_roll in [7, 11]:
             # Natural win
@@ -179,12 +364,22 @@ def simulate_round(use_pass_line=True, numbers_rolled_so_far=None, round_num=0):
 
     # Point is established
     point = come_out_roll
+    if uses_state:
+        state['point'] = point
 
-    # Place odds bet
-    total_payout -= bet_odds
+    # Place odds bet, odds tables cover every point
+    odds_rule = betting_strategy['odds_bet']
+    odds_bet = odds_rule[point] if type(odds_rule) is list else odds_rule(state, point)
+    total_payout -= odds_bet
 
     if debug:
-        roll_details.append(f"  Point is {point}. Placed ${bet_odds} odds bet")
+        roll_details.append(f"  Point is {point}.{f' Placed ${odds_bet} odds bet' if odds_bet else ''}")
+
+    # Come bet waiting for its first roll
+    come_bet = 0
+    if max_come:
+        come_bet = place_come_bet(betting_strategy, state, come_points, roll_details)
+        total_payout -= come_bet
 
     # Roll until point or 7
     while True:
@@ -197,38 +392,42 @@ def simulate_round(use_pass_line=True, numbers_rolled_so_far=None, round_num=0):
         if debug:
             roll_details.append(f"  Roll: {roll}")
 
-        if use_pass_line:
+        if max_come:
+            payout, come_bet = play_come_bets(roll, point, come_bet, betting_strategy, state, come_points, roll_details)
+            total_payout += payout
+
+        if pass_line:
             if roll == point:
                 # Win - return main bet + winnings
                 main_win = main_bet
-                odds_win = calculate_odds_payout(point, bet_odds, True, True)
+                odds_win = calculate_odds_payout(point, odds_bet, True, True)
                 total_payout += main_bet * 2
-                total_payout += bet_odds + odds_win
+                total_payout += odds_bet + odds_win
                 if debug:
                     roll_details.append(f"  Point {point} made! Pass Line WINS ${main_win}, Odds WINS ${odds_win}")
                 return create_result(total_payout, 'win', point, all_rolls, False, roll_details)
             elif roll == 7:
                 # Lose both bets (already subtracted)
                 if debug:
-                    roll_details.append(f"  Seven out! Pass Line LOSES ${main_bet}, Odds LOSES ${bet_odds}")
+                    roll_details.append(f"  Seven out! Pass Line LOSES ${main_bet}, Odds LOSES ${odds_bet}")
                 return create_result(total_payout, 'lose', point, all_rolls, True, roll_details)
         else:
             if roll == 7:
                 # Win for don't pass
                 main_win = main_bet
-                odds_win = calculate_odds_payout(point, bet_odds, False, True)
+                odds_win = calculate_odds_payout(point, odds_bet, False, True)
                 total_payout += main_bet * 2
-                total_payout += bet_odds + odds_win
+                total_payout += odds_bet + odds_win
                 if debug:
                     roll_details.append(f"  Seven out! Don't Pass WINS ${main_win}, Odds WINS ${odds_win}")
                 return create_result(total_payout, 'win', point, all_rolls, True, roll_details)
             elif roll == point:
                 # Lose both bets (already subtracted)
                 if debug:
-                    roll_details.append(f"  Point {point} made! Don't Pass LOSES ${main_bet}, Odds LOSES ${bet_odds}")
+                    roll_details.append(f"  Point {point} made! Don't Pass LOSES ${main_bet}, Odds LOSES ${odds_bet}")
                 return create_result(total_payout, 'lose', point, all_rolls, False, roll_details)
 
-def run_single_simulation(sim_num):
+def run_single_simulation(sim_num, betting_strategy):
     """Run a single simulation until completion based on simulation_mode"""
     total_bankroll = 0
     low_hits = 0
@@ -246,6 +445,20 @@ def run_single_simulation(sim_num):
     high_numbers = {8, 9, 10, 11, 12}
     all_numbers = low_numbers | high_numbers
 
+    # Come bets on numbers, carried across rounds
+    come_points = {}
+
+    # State the strategy decides its bets from, only kept current for strategies with rule functions
+    uses_state = betting_strategy['uses_state']
+    track_losses = uses_state or len(betting_strategy['main_bet']) > 1
+    state = {
+        'bankroll': total_bankroll,
+        'point': None,
+        'numbers_rolled': frozenset(),
+        'losses_in_row': 0,
+        'come_points': MappingProxyType(come_points)
+    }
+
     # Place initial side bets
     total_bankroll -= (bet_low_numbers + bet_high_numbers + bet_all_numbers)
 
@@ -272,9 +485,19 @@ def run_single_simulation(sim_num):
         run += 1
         bankroll_before = total_bankroll
 
-        result = simulate_round(use_pass_line=(strategy == 'pass_line'), round_num=run+1)
+        if uses_state:
+            state['bankroll'] = total_bankroll
+            state['numbers_rolled'] = frozenset(numbers_rolled)
+        result = simulate_round(betting_strategy, state, come_points, round_num=run+1)
         total_bankroll += result['total']
 
+        # Track losing streak for progressions
+        if track_losses:
+            if result['main_result'] == 'lose':
+                state['losses_in_row'] += 1
+            elif result['main_result'] == 'win':
+                state['losses_in_row'] = 0
+
         # Print roll details
         if debug:
             for detail in result.get('roll_details', []):
@@ -346,6 +569,14 @@ def run_single_simulation(sim_num):
             print(f"  Running bankroll: ${total_bankroll:.2f}")
             print()
 
+    # Come bets can't be taken down, so roll them out once the simulation stops
+    if come_points:
+        if debug:
+            print(f"Settling come bets left on {sorted(come_points)}")
+        total_bankroll += settle_outstanding_come_points(come_points, betting_strategy['pass_line'])
+        if debug:
+            print(f"Final bankroll: ${total_bankroll:.2f}")
+
     return {
         'final_bankroll': total_bankroll,
         'rounds_played': run,
@@ -402,128 +633,153 @@ def print_bet_statistics(avg_dice_rolls, avg_rounds, avg_low_hits, avg_high_hits
                 print(f"  Win frequency: 1 in every {avg_dice_rolls/avg_field_wins:.1f} rolls")
                 print(f"  Win rate: {(avg_field_wins/avg_dice_rolls)*100:.2f}%")
 
-### MAIN EXECUTION ###
-
-# Run multiple simulations
-if simulation_mode == 'fixed_rounds':
-    print(f"Running {num_simulations} simulations of {total_rounds:,} rounds each...")
-elif simulation_mode == 'threshold':
-    print(f"Running {num_simulations} simulations until win/loss threshold...")
-    print(f"  Win threshold: ${win_threshold:+.2f}")
-    print(f"  Loss threshold: ${loss_threshold:+.2f}")
-
-final_bankrolls = []
-rounds_played_list = []
-all_low_hits = []
-all_high_hits = []
-all_all_hits = []
-all_dice_rolls = []
-all_twelve_hits = []
-all_field_wins = []
-
-for sim in range(num_simulations):
-    result = run_single_simulation(sim + 1)
-    final_bankrolls.append(result['final_bankroll'])
-    rounds_played_list.append(result['rounds_played'])
-    all_low_hits.append(result['low_hits'])
-    all_high_hits.append(result['high_hits'])
-    all_all_hits.append(result['all_hits'])
-    all_dice_rolls.append(result['total_dice_rolls'])
-    all_twelve_hits.append(result['twelve_hits'])
-    all_field_wins.append(result['field_wins'])
-
-    if (sim + 1) % 100 == 0:
-        print(f"  Completed {sim + 1}/{num_simulations} simulations...")
-
-### RESULTS ANALYSIS ###
-
-# Calculate statistics on final bankrolls
-final_bankrolls.sort()
-
 def percentile(data, perc):
     """Get percentile from sorted data"""
     index = int(len(data) * perc / 100)
     return data[index] if index < len(data) else data[-1]
 
-# Print results summary
-print(f"\n=== Craps Simulation Results ===")
-print(f"Simulation mode: {simulation_mode}")
-print(f"Strategy: {strategy.replace('_', ' ').title()}")
-print(f"Number of simulations: {num_simulations}")
-
-if simulation_mode == 'fixed_rounds':
-    print(f"Rounds per simulation: {total_rounds:,}")
-elif simulation_mode == 'threshold':
-    print(f"Win threshold: ${win_threshold:+.2f}")
-    print(f"Loss threshold: ${loss_threshold:+.2f}")
-
-print(f"\nBet amounts:")
-if bet_pass_line > 0:
-    print(f"  Main bet (per round): ${bet_pass_line}")
-if bet_odds > 0:
-    print(f"  Odds bet (per round when point established): ${bet_odds}")
-if bet_field > 0:
-    print(f"  Field bet (per dice roll): ${bet_field}")
-if bet_twelve > 0:
-    print(f"  Twelve bet (per dice roll): ${bet_twelve}")
-if bet_low_numbers > 0:
-    print(f"  Low numbers side bet (per cycle): ${bet_low_numbers}")
-if bet_high_numbers > 0:
-    print(f"  High numbers side bet (per cycle): ${bet_high_numbers}")
-if bet_all_numbers > 0:
-    print(f"  All numbers side bet (per cycle): ${bet_all_numbers}")
-
-# Show bankroll distribution only for fixed_rounds mode
-if simulation_mode == 'fixed_rounds':
-    print(f"\n=== Final Bankroll Distribution ===")
-    print(f"Minimum: ${final_bankrolls[0]:,.2f}")
-    print(f"5th Percentile: ${percentile(final_bankrolls, 5):,.2f}")
-    print(f"25th Percentile: ${percentile(final_bankrolls, 25):,.2f}")
-    print(f"Median (50th): ${percentile(final_bankrolls, 50):,.2f}")
-    print(f"Average: ${sum(final_bankrolls)/len(final_bankrolls):,.2f}")
-    print(f"75th Percentile: ${percentile(final_bankrolls, 75):,.2f}")
-    print(f"95th Percentile: ${percentile(final_bankrolls, 95):,.2f}")
-    print(f"Maximum: ${final_bankrolls[-1]:,.2f}")
-
-# Show outcomes
-if simulation_mode == 'fixed_rounds':
-    positive = sum(1 for b in final_bankrolls if b > 0)
-    negative = sum(1 for b in final_bankrolls if b < 0)
-    even = sum(1 for b in final_bankrolls if b == 0)
-    print(f"\nOutcomes:")
-    print(f"  Ended positive: {positive} ({positive/num_simulations*100:.1f}%)")
-    print(f"  Ended negative: {negative} ({negative/num_simulations*100:.1f}%)")
-    print(f"  Ended even: {even} ({even/num_simulations*100:.1f}%)")
-elif simulation_mode == 'threshold':
-    wins = sum(1 for b in final_bankrolls if b >= win_threshold)
-    losses = sum(1 for b in final_bankrolls if b <= loss_threshold)
-    incomplete = num_simulations - wins - losses
-
-    print(f"\n=== Threshold Outcomes ===")
-    print(f"  Hit WIN threshold: {wins} ({wins/num_simulations*100:.1f}%)")
-    print(f"  Hit LOSS threshold: {losses} ({losses/num_simulations*100:.1f}%)")
-    if incomplete > 0:
-        print(f"  Incomplete (hit max rounds): {incomplete} ({incomplete/num_simulations*100:.1f}%)")
-
-    # Sort rounds list for percentile calculations
-    rounds_played_sorted = sorted(rounds_played_list)
-    print(f"\n=== Rounds Until Completion ===")
-    print(f"Minimum: {rounds_played_sorted[0]:,}")
-    print(f"5th Percentile: {percentile(rounds_played_sorted, 5):,.0f}")
-    print(f"25th Percentile: {percentile(rounds_played_sorted, 25):,.0f}")
-    print(f"Median: {percentile(rounds_played_sorted, 50):,.0f}")
-    print(f"Average: {sum(rounds_played_list)/len(rounds_played_list):,.1f}")
-    print(f"75th Percentile: {percentile(rounds_played_sorted, 75):,.0f}")
-    print(f"95th Percentile: {percentile(rounds_played_sorted, 95):,.0f}")
-    print(f"Maximum: {rounds_played_sorted[-1]:,}")
-
-# Print bet-specific statistics
-print_bet_statistics(
-    avg_dice_rolls=sum(all_dice_rolls)/num_simulations,
-    avg_rounds=sum(rounds_played_list)/num_simulations,
-    avg_low_hits=sum(all_low_hits)/num_simulations,
-    avg_high_hits=sum(all_high_hits)/num_simulations,
-    avg_all_hits=sum(all_all_hits)/num_simulations,
-    avg_twelve_hits=sum(all_twelve_hits)/num_simulations,
-    avg_field_wins=sum(all_field_wins)/num_simulations
-)
+### MAIN EXECUTION ###
+
+def main():
+    """Run all simulations and print the results"""
+    strategies = build_strategies()
+    if strategy not in strategies:
+        raise ValueError(f"Unknown strategy '{strategy}', choose from: {', '.join(strategies)}")
+    betting_strategy = strategies[strategy]
+
+    # Run multiple simulations
+    if simulation_mode == 'fixed_rounds':
+        print(f"Running {num_simulations} simulations of {total_rounds:,} rounds each...")
+    elif simulation_mode == 'threshold':
+        print(f"Running {num_simulations} simulations until win/loss threshold...")
+        print(f"  Win threshold: ${win_threshold:+.2f}")
+        print(f"  Loss threshold: ${loss_threshold:+.2f}")
+
+    final_bankrolls = []
+    rounds_played_list = []
+    all_low_hits = []
+    all_high_hits = []
+    all_all_hits = []
+    all_dice_rolls = []
+    all_twelve_hits = []
+    all_field_wins = []
+
+    for sim in range(num_simulations):
+        result = run_single_simulation(sim + 1, betting_strategy)
+        final_bankrolls.append(result['final_bankroll'])
+        rounds_played_list.append(result['rounds_played'])
+        all_low_hits.append(result['low_hits'])
+        all_high_hits.append(result['high_hits'])
+        all_all_hits.append(result['all_hits'])
+        all_dice_rolls.append(result['total_dice_rolls'])
+        all_twelve_hits.append(result['twelve_hits'])
+        all_field_wins.append(result['field_wins'])
+
+        if (sim + 1) % 100 == 0:
+            print(f"  Completed {sim + 1}/{num_simulations} simulations...")
+
+    ### RESULTS ANALYSIS ###
+
+    # Calculate statistics on final bankrolls
+    final_bankrolls.sort()
+
+    # Print results summary
+    print(f"\n=== Craps Simulation Results ===")
+    print(f"Simulation mode: {simulation_mode}")
+    print(f"Strategy: {betting_strategy['name'] or strategy.replace('_', ' ').title()}")
+    print(f"Number of simulations: {num_simulations}")
+
+    if simulation_mode == 'fixed_rounds':
+        print(f"Rounds per simulation: {total_rounds:,}")
+    elif simulation_mode == 'threshold':
+        print(f"Win threshold: ${win_threshold:+.2f}")
+        print(f"Loss threshold: ${loss_threshold:+.2f}")
+
+    print(f"\nBet amounts:")
+    main_rule = betting_strategy['main_bet']
+    if type(main_rule) is list and len(main_rule) > 1:
+        print(f"  Main bet (per round, by losses in a row): {', '.join(f'${bet}' for bet in main_rule)}")
+    elif type(main_rule) is list and main_rule[0] > 0:
+        print(f"  Main bet (per round): ${main_rule[0]}")
+    elif type(main_rule) is not list:
+        print(f"  Main bet (per round): set by strategy")
+    odds_rule = betting_strategy['odds_bet']
+    if type(odds_rule) is list and any(odds_rule):
+        point_odds = [odds_rule[point] for point in POINT_NUMBERS]
+        if len(set(point_odds)) == 1:
+            print(f"  Odds bet (per round when point established): ${point_odds[0]}")
+        else:
+            print(f"  Odds bet (per point established): "
+                  f"{', '.join(f'{point}: ${odds}' for point, odds in zip(POINT_NUMBERS, point_odds))}")
+    elif type(odds_rule) is not list:
+        print(f"  Odds bet (per point established): set by strategy")
+    if betting_strategy['max_come_bets'] > 0:
+        print(f"  Come bets (per roll while a point is on): up to {betting_strategy['max_come_bets']} working")
+    if bet_field > 0:
+        print(f"  Field bet (per dice roll): ${bet_field}")
+    if bet_twelve > 0:
+        print(f"  Twelve bet (per dice roll): ${bet_twelve}")
+    if bet_low_numbers > 0:
+        print(f"  Low numbers side bet (per cycle): ${bet_low_numbers}")
+    if bet_high_numbers > 0:
+        print(f"  High numbers side bet (per cycle): ${bet_high_numbers}")
+    if bet_all_numbers > 0:
+        print(f"  All numbers side bet (per cycle): ${bet_all_numbers}")
+
+    # Show bankroll distribution only for fixed_rounds mode
+    if simulation_mode == 'fixed_rounds':
+        print(f"\n=== Final Bankroll Distribution ===")
+        print(f"Minimum: ${final_bankrolls[0]:,.2f}")
+        print(f"5th Percentile: ${percentile(final_bankrolls, 5):,.2f}")
+        print(f"25th Percentile: ${percentile(final_bankrolls, 25):,.2f}")
+        print(f"Median (50th): ${percentile(final_bankrolls, 50):,.2f}")
+        print(f"Average: ${sum(final_bankrolls)/len(final_bankrolls):,.2f}")
+        print(f"75th Percentile: ${percentile(final_bankrolls, 75):,.2f}")
+        print(f"95th Percentile: ${percentile(final_bankrolls, 95):,.2f}")
+        print(f"Maximum: ${final_bankrolls[-1]:,.2f}")
+
+    # Show outcomes
+    if simulation_mode == 'fixed_rounds':
+        positive = sum(1 for b in final_bankrolls if b > 0)
+        negative = sum(1 for b in final_bankrolls if b < 0)
+        even = sum(1 for b in final_bankrolls if b == 0)
+        print(f"\nOutcomes:")
+        print(f"  Ended positive: {positive} ({positive/num_simulations*100:.1f}%)")
+        print(f"  Ended negative: {negative} ({negative/num_simulations*100:.1f}%)")
+        print(f"  Ended even: {even} ({even/num_simulations*100:.1f}%)")
+    elif simulation_mode == 'threshold':
+        wins = sum(1 for b in final_bankrolls if b >= win_threshold)
+        losses = sum(1 for b in final_bankrolls if b <= loss_threshold)
+        incomplete = num_simulations - wins - losses
+
+        print(f"\n=== Threshold Outcomes ===")
+        print(f"  Hit WIN threshold: {wins} ({wins/num_simulations*100:.1f}%)")
+        print(f"  Hit LOSS threshold: {losses} ({losses/num_simulations*100:.1f}%)")
+        if incomplete > 0:
+            print(f"  Incomplete (hit max rounds): {incomplete} ({incomplete/num_simulations*100:.1f}%)")
+
+        # Sort rounds list for percentile calculations
+        rounds_played_sorted = sorted(rounds_played_list)
+        print(f"\n=== Rounds Until Completion ===")
+        print(f"Minimum: {rounds_played_sorted[0]:,}")
+        print(f"5th Percentile: {percentile(rounds_played_sorted, 5):,.0f}")
+        print(f"25th Percentile: {percentile(rounds_played_sorted, 25):,.0f}")
+        print(f"Median: {percentile(rounds_played_sorted, 50):,.0f}")
+        print(f"Average: {sum(rounds_played_list)/len(rounds_played_list):,.1f}")
+        print(f"75th Percentile: {percentile(rounds_played_sorted, 75):,.0f}")
+        print(f"95th Percentile: {percentile(rounds_played_sorted, 95):,.0f}")
+        print(f"Maximum: {rounds_played_sorted[-1]:,}")
+
+    # Print bet-specific statistics
+    print_bet_statistics(
+        avg_dice_rolls=sum(all_dice_rolls)/num_simulations,
+        avg_rounds=sum(rounds_played_list)/num_simulations,
+        avg_low_hits=sum(all_low_hits)/num_simulations,
+        avg_high_hits=sum(all_high_hits)/num_simulations,
+        avg_all_hits=sum(all_all_hits)/num_simulations,
+        avg_twelve_hits=sum(all_twelve_hits)/num_simulations,
+        avg_field_wins=sum(all_field_wins)/num_simulations
+    )
+
+if __name__ == '__main__':
+    main()
@@ -22,46 +22,51 @@ pairs = {
     98:79
 }
 
-totalturns = 0 #sum of all turns, for average
-turnlist = [] #list of all turn results for min/max/median
-turnfrequency = [0]*300 #count of occurrences per turn number for graphing
-mode_turns = 0
-mode_count = 0
-for run in range(totalruns):
-    turns = 0
-    position = 0
-    while position != 100:
-        turns += 1
-        roll = random.randint(1,6)
-        newposition = position + roll
-        if newposition in pairs:
-            position = pairs[newposition]
-        elif newposition <= 100:
-            position = newposition
-    turnlist.append(turns)
-    totalturns += turns
-    turnfrequency[turns] = turnfrequency[turns] + 1
-    if turnfrequency[turns] > mode_count:
-        mode_turns = turns
-        mode_count = turnfrequency[turns]
+def main():
+    totalturns = 0 #sum of all turns, for average
+    turnlist = [] #list of all turn results for min/max/median
+    turnfrequency = {} #count of occurrences per turn number for graphing, games have no upper turn limit
+    mode_turns = 0
+    mode_count = 0
+    for run in range(totalruns):
+        turns = 0
+        position = 0
+        while position != 100:
+            turns += 1
+            roll = random.randint(1,6)
+            newposition = position + roll
+            if newposition in pairs:
+                position = pairs[newposition]
+            elif newposition <= 100:
+                position = newposition
+        turnlist.append(turns)
+        totalturns += turns
+        turnfrequency[turns] = turnfrequency.get(turns, 0) + 1
+        if turnfrequency[turns] > mode_count:
+            mode_turns = turns
+            mode_count = turnfrequency[turns]
 
-turnlist.sort()
+    turnlist.sort()
 
-def turnlist_percentile(perc):
-    return turnlist[int(round(len(turnlist)*perc/100.0))]
-    
-print("Over " + str(totalruns) + " runs:")
-print("Minimum: " + str(turnlist[0]))
-print("5th Percentile: " + str(turnlist_percentile(5)))
-print("25th Percentile: " + str(turnlist_percentile(25)))
-print("Mode: " + str(mode_turns) + " (" + str(mode_count) + " occurrences)")
-print("Median: " + str(turnlist_percentile(50)))
-print("Average: " + str(totalturns/totalruns))
-print("75th Percentile: " + str(turnlist_percentile(75)))
-print("95th Percentile: " + str(turnlist_percentile(95)))
-print("Maximum: " + str(turnlist[totalruns-1]))
+    def turnlist_percentile(perc):
+        index = int(round(len(turnlist)*perc/100.0))
+        return turnlist[min(index, len(turnlist)-1)] #clamp for small run counts
 
-print("=========")
-print("Occurrence Graph:")
-for turnnumber in range(turnlist[0],turnlist[totalruns-1]+1):
-    print(str(turnnumber) + ":" + ("x"*turnfrequency[turnnumber]))
\ No newline at end of file
+    print("Over " + str(totalruns) + " runs:")
+    print("Minimum: " + str(turnlist[0]))
+    print("5th Percentile: " + str(turnlist_percentile(5)))
+    print("25th Percentile: " + str(turnlist_percentile(25)))
+    print("Mode: " + str(mode_turns) + " (" + str(mode_count) + " occurrences)")
+    print("Median: " + str(turnlist_percentile(50)))
+    print("Average: " + str(totalturns/totalruns))
+    print("75th Percentile: " + str(turnlist_percentile(75)))
+    print("95th Percentile: " + str(turnlist_percentile(95)))
+    print("Maximum: " + str(turnlist[totalruns-1]))
+
+    print("=========")
+    print("Occurrence Graph:")
+    for turnnumber in range(turnlist[0],turnlist[totalruns-1]+1):
+        print(str(turnnumber) + ":" + ("x"*turnfrequency.get(turnnumber, 0)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,273 @@
+"""
+Simulation Service
+
+Local asyncio HTTP service that runs the game simulators for the dashboard,
+instead of rerunning the scripts from scratch for every request.
+
+- Simulations run on a process pool, with configuration overrides applied per request
+- Identical in-flight requests are coalesced onto a single run
+- Results are cached in an LRU keyed by a canonical hash of game, config and seed
+
+Unseeded requests are coalesced while in flight but never cached, so each load gets a fresh sample.
+
+Example request:
+    curl -X POST http://127.0.0.1:8765/simulate \\
+         -d '{"game": "craps", "config": {"strategy": "martingale", "num_simulations": 1000}, "seed": 7}'
+
+Response: {"key": ..., "source": "computed" | "coalesced" | "cache", "output": <printed report>}
+"""
+
+import asyncio
+import hashlib
+import importlib
+import io
+import json
+import random
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+### CONFIGURATION SECTION ###
+host = '127.0.0.1'  # address to listen on
+port = 8765  # TCP port to listen on
+unix_socket = None  # set to a path to listen on a Unix socket instead of TCP
+workers = None  # number of simulation processes, None for one per CPU
+cache_size = 256  # number of simulation results kept in the LRU cache
+### END CONFIGURATION SECTION ###
+
+# Games that can be simulated, mapped to their simulator module
+GAMES = {
+    'craps': 'craps',
+    'shoots_and_ladders': 'shoots_and_ladders'
+}
+
+# Allowed values for string settings, read from the simulator module
+SETTING_CHOICES = {
+    'craps': {
+        'simulation_mode': lambda module: ('fixed_rounds', 'threshold'),
+        'strategy': lambda module: tuple(module.build_strategies())
+    }
+}
+
+# Minimum values for count settings, so a request cannot hang or divide by zero
+SETTING_MINIMUMS = {
+    'craps': {'num_simulations': 1, 'total_rounds': 0, 'max_rounds': 1,
+              'martingale_max_doublings': 0, 'max_come_bets': 0},
+    'shoots_and_ladders': {'totalruns': 1}
+}
+
+# Maximum values for count settings, so one request cannot tie up a worker indefinitely
+SETTING_MAXIMUMS = {
+    'craps': {'num_simulations': 100000, 'total_rounds': 100000, 'max_rounds': 100000,
+              'martingale_max_doublings': 20, 'max_come_bets': 6},
+    'shoots_and_ladders': {'totalruns': 100000}
+}
+
+# Most craps rounds a fixed_rounds request may ask for (num_simulations * total_rounds)
+MAX_CRAPS_ROUNDS = 10000000
+
+# Settings a request may never override: seed is its own request field, debug output is unbounded
+EXCLUDED_SETTINGS = ('seed', 'debug')
+
+HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                500: 'Internal Server Error'}
+
+### REQUEST HANDLING FUNCTIONS ###
+
+def configurable_settings(module):
+    """Return the simulator's configuration settings a request may override, with their defaults"""
+    return {name: value for name, value in vars(module).items()
+            if not name.startswith('_') and name not in EXCLUDED_SETTINGS
+            and (value is None or type(value) in (int, float, str, bool))}
+
+def parse_simulation_request(request):
+    """
+    Validate a simulation request and return (game, config, seed).
+    Config only keeps overrides that differ from the simulator defaults,
+    so requests that spell out a default share a cache entry.
+    """
+    if not isinstance(request, dict):
+        raise ValueError("request must be a JSON object")
+
+    game = request.get('game')
+    if not isinstance(game, str) or game not in GAMES:
+        raise ValueError(f"unknown game {game!r}, choose from: {', '.join(GAMES)}")
+
+    seed = request.get('seed')
+    if seed is not None and type(seed) is not int:
+        raise ValueError("seed must be an integer or null")
+
+    overrides = request.get('config', {})
+    if not isinstance(overrides, dict):
+        raise ValueError("config must be a JSON object")
+
+    module = importlib.import_module(GAMES[game])
+    settings = configurable_settings(module)
+    choices = SETTING_CHOICES.get(game, {})
+    minimums = SETTING_MINIMUMS.get(game, {})
+    maximums = SETTING_MAXIMUMS.get(game, {})
+    config = {}
+    for name, value in overrides.items():
+        if name not in settings:
+            raise ValueError(f"unknown {game} setting {name!r}")
+        default = settings[name]
+        if default is not None and type(value) is not type(default) \
+                and not (type(default) is float and type(value) is int):
+            raise ValueError(f"{game} setting {name!r} must be of type {type(default).__name__}")
+        if name in choices and value not in choices[name](module):
+            raise ValueError(f"{game} setting {name!r} must be one of: {', '.join(choices[name](module))}")
+        if name in minimums and value < minimums[name]:
+            raise ValueError(f"{game} setting {name!r} must be at least {minimums[name]}")
+        if name in maximums and value > maximums[name]:
+            raise ValueError(f"{game} setting {name!r} must be at most {maximums[name]}")
+        if value != default:
+            config[name] = value
+
+    if game == 'craps':
+        effective = {**settings, **config}
+        if effective['simulation_mode'] == 'fixed_rounds' \
+                and effective['num_simulations'] * effective['total_rounds'] > MAX_CRAPS_ROUNDS:
+            raise ValueError(f"craps num_simulations * total_rounds must be at most {MAX_CRAPS_ROUNDS}")
+
+    return game, config, seed
+
+def request_key(game, config, seed):
+    """Canonical hash of a simulation request, used for caching and coalescing"""
+    canonical = json.dumps({'game': game, 'config': config, 'seed': seed}, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+def run_simulation(game, config, seed):
+    """Run a simulator in a pool worker with config overrides applied, return its printed report"""
+    module = importlib.import_module(GAMES[game])
+    defaults = {name: getattr(module, name) for name in config}
+    output = io.StringIO()
+
+    try:
+        for name, value in config.items():
+            setattr(module, name, value)
+        random.seed(seed)
+        with redirect_stdout(output):
+            module.main()
+    finally:
+        # Pool workers are reused, so restore the defaults for the next request
+        for name, value in defaults.items():
+            setattr(module, name, value)
+
+    return output.getvalue()
+
+class SimulationService:
+    """Runs simulations on a process pool, coalescing identical in-flight requests and caching results"""
+
+    def __init__(self, pool, cache_size):
+        self.pool = pool
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # key -> output, least recently used first
+        self.in_flight = {}  # key -> future of the running simulation
+
+    async def simulate(self, game, config, seed):
+        """Return (key, source, output) where source is 'cache', 'coalesced' or 'computed'"""
+        key = request_key(game, config, seed)
+        cacheable = seed is not None  # an unseeded request asks for a fresh sample
+
+        if cacheable and key in self.cache:
+            self.cache.move_to_end(key)
+            return key, 'cache', self.cache[key]
+
+        future = self.in_flight.get(key)
+        if future is not None:
+            source = 'coalesced'
+        else:
+            source = 'computed'
+            future = asyncio.get_running_loop().run_in_executor(self.pool, run_simulation, game, config, seed)
+            future.add_done_callback(lambda done: self.finish(key, done, cacheable))
+            self.in_flight[key] = future
+
+        # Shield so a client disconnecting does not cancel work other requests wait on
+        return key, source, await asyncio.shield(future)
+
+    def finish(self, key, future, cacheable):
+        """Move a completed simulation from in-flight into the cache"""
+        del self.in_flight[key]
+        if not cacheable or future.cancelled() or future.exception() is not None:
+            return
+
+        self.cache[key] = future.result()
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+async def dispatch(service, method, path, body):
+    """Route an HTTP request, return (status, payload)"""
+    if path != '/simulate':
+        return 404, {'error': f"no such endpoint {path}"}
+    if method != 'POST':
+        return 405, {'error': "use POST"}
+
+    try:
+        game, config, seed = parse_simulation_request(json.loads(body or b'{}'))
+    except ValueError as e:  # includes malformed JSON
+        return 400, {'error': str(e)}
+
+    try:
+        key, source, output = await service.simulate(game, config, seed)
+    except Exception as e:
+        return 500, {'error': f"{game} simulation failed: {e!r}"}
+
+    return 200, {'key': key, 'source': source, 'output': output}
+
+async def handle_connection(reader, writer, service):
+    """Read one HTTP request from the connection, answer it with JSON and close"""
+    status, payload = 500, {'error': "internal server error"}
+    try:
+        method, path, _ = (await reader.readline()).decode('latin-1').split(' ', 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        body = await reader.readexactly(int(headers.get('content-length', 0)))
+        status, payload = await dispatch(service, method, path.split('?')[0], body)
+    except (ValueError, asyncio.IncompleteReadError):
+        status, payload = 400, {'error': "malformed HTTP request"}
+    except Exception as e:
+        status, payload = 500, {'error': f"internal server error: {e!r}"}
+    finally:
+        # Always answer and close, even if handling the request failed unexpectedly
+        content = json.dumps(payload).encode()
+        try:
+            writer.write(f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+                         f"Content-Type: application/json\r\n"
+                         f"Content-Length: {len(content)}\r\n"
+                         f"Connection: close\r\n\r\n".encode('latin-1') + content)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+### MAIN EXECUTION ###
+
+async def serve():
+    """Start the service and run until interrupted"""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        service = SimulationService(pool, cache_size)
+
+        async def handler(reader, writer):
+            await handle_connection(reader, writer, service)
+
+        if unix_socket is not None:
+            server = await asyncio.start_unix_server(handler, path=unix_socket)
+            print(f"Serving simulations on unix socket {unix_socket}")
+        else:
+            server = await asyncio.start_server(handler, host, port)
+            print(f"Serving simulations on http://{host}:{port}/simulate")
+
+        async with server:
+            await server.serve_forever()
+
+if __name__ == '__main__':
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass